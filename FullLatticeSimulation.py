@@ -16,7 +16,6 @@ import regionToolset
 
 
 from Lattice import *
-import re
 from Materials import *
 
 from Lattice_description import *
@@ -30,6 +29,31 @@ from Lattice_description import *
 # *******************************************************************************************************************
 # *******************************************************************************************************************
 
+# Parts already looked up in mdb, by (name_model, name_Part).
+# Only CreateModel, CreatePart and delete_all_models keep it up to date : after Mdb(), openMdb() or a part
+# replaced in another way (ex. surface part of Assembly_beam_Surface), call _PART_CACHE.clear()
+_PART_CACHE = {}
+
+
+def _get_part(name_model, name_Part):
+    """
+    Get a part of a model, the lookup in mdb is done only once per part
+
+    Parameters
+    ----------
+    name_model : str
+        Name of the model.
+    name_Part : str
+        Name of the part.
+    """
+    key = (name_model, name_Part)
+    p = _PART_CACHE.get(key)
+    if p is None:
+        p = mdb.models[name_model].parts[name_Part]
+        _PART_CACHE[key] = p
+    return p
+
+
 def CreateModel(name_model):
     """
     Create a model in Abaqus
@@ -41,6 +65,9 @@ def CreateModel(name_model):
     """
     # Create Model
     mdb.Model(name=name_model, modelType=STANDARD_EXPLICIT)
+    # Parts of a previous model with the same name are no longer valid
+    for key in [key for key in _PART_CACHE if key[0] == name_model]:
+        del _PART_CACHE[key]
 
 
 def CreatePart(name_model, name_Part):
@@ -63,10 +90,9 @@ def CreatePart(name_model, name_Part):
     s1.VerticalConstraint(entity=g[2], addUndoState=False)
     p = mdb.models[name_model].Part(name=name_Part, dimensionality=THREE_D,
                                     type=DEFORMABLE_BODY)
-    p = mdb.models[name_model].parts[name_Part]
+    _PART_CACHE[(name_model, name_Part)] = p
     p.BaseWire(sketch=s1)
     s1.unsetPrimaryObject()
-    p = mdb.models[name_model].parts[name_Part]
     del mdb.models[name_model].sketches['__profile__']
     # Delete Part
     del p.features['Wire-1']
@@ -83,9 +109,17 @@ def CreateNodes(name_model, name_Part):
     name_Part : str
         Name of the part.
     """
-    p = mdb.models[name_model].parts[name_Part]
-    for i in range(len(lattice.nodes)):
-        p.DatumPointByCoordinate(coords=(lattice.nodes[i][1], lattice.nodes[i][2], lattice.nodes[i][3]))
+    p = _get_part(name_model, name_Part)
+    # Extract coordinates once as native floats for the Abaqus API
+    coords = lattice.nodes_np[:, 1:4]
+    # No viewport update for each datum point
+    vp = session.viewports['Viewport: 1']
+    vp.disableRefresh()
+    try:
+        for x, y, z in coords.tolist():
+            p.DatumPointByCoordinate(coords=(x, y, z))
+    finally:
+        vp.enableRefresh()
 
 
 def CreateBeams(name_model, name_Part):
@@ -99,48 +133,50 @@ def CreateBeams(name_model, name_Part):
     name_Part : str
         Name of the part.
     """
-    p = mdb.models[name_model].parts[name_Part]
+    p = _get_part(name_model, name_Part)
     d2 = p.datums
-    idx_default = 2
-    beam_points = []
-    for i in range(len(lattice.beams)):
-        # Debug when element index is greater than 999
-        idx1 = 3 if int(lattice.beams[i][1]) + 2 > 999 else idx_default
-        idx2 = 3 if int(lattice.beams[i][2]) + 2 > 999 else idx_default
-
-        datum1 = d2[int(lattice.beams[i][1]) + idx1]
-        datum2 = d2[int(lattice.beams[i][2]) + idx2]
-
-        beam_points.append((datum1, datum2))
+    beams = lattice.beams_np
+    n1 = beams[:, 1].astype(np.int64)
+    n2 = beams[:, 2].astype(np.int64)
+    # Debug when element index is greater than 999
+    k1 = (n1 + np.where(n1 + 2 > 999, 3, 2)).tolist()
+    k2 = (n2 + np.where(n2 + 2 > 999, 3, 2)).tolist()
+    beam_points = [(d2[a], d2[b]) for a, b in zip(k1, k2)]
 
     p.WirePolyLine(points=beam_points, mergeType=IMPRINT, meshable=ON)
 
 
 def SetAbaqusWindows(name_model, name_Part):
-    p = mdb.models[name_model].parts[name_Part]
+    p = _get_part(name_model, name_Part)
     session.viewports['Viewport: 1'].setValues(displayedObject=p)
 
 
 def Assembly_beam(name_model, name_Part, name_Assembly):
     a1 = mdb.models[name_model].rootAssembly
     a1.DatumCsysByDefault(CARTESIAN)
-    p = mdb.models[name_model].parts[name_Part]
+    p = _get_part(name_model, name_Part)
     a1.Instance(name=name_Assembly, part=p, dependent=ON)
 
 
 def Assembly_beam_Surface(name_model, name_Part, name_surface):
     # Assembly 2 parts and move surface at good position
     a1 = mdb.models[name_model].rootAssembly
-    p = mdb.models[name_model].parts[name_Part]
+    p = _get_part(name_model, name_Part)
     name_Part_Assembly = name_Part + '-1'
     a1.Instance(name=name_Part_Assembly, part=p, dependent=ON)
-    p = mdb.models[name_model].parts[name_surface]
+    p = _get_part(name_model, name_surface)
     name_surface_Assembly = name_surface + '-1'
     a1.Instance(name=name_surface_Assembly, part=p, dependent=ON)
     a1.translate(instanceList=(name_surface_Assembly,), vector=(0.0, 0.0, lattice.zMax + 0.1 * lattice.zMax))
     return name_Part_Assembly, name_surface_Assembly
 
 
+# Position of a set -> (column of the coordinate in node data, lattice bound attribute)
+_POSITIONS = {'x+': (1, 'xMax'), 'x-': (1, 'xMin'),
+              'y+': (2, 'yMax'), 'y-': (2, 'yMin'),
+              'z+': (3, 'zMax'), 'z-': (3, 'zMin')}
+
+
 def CreateSet(name_model, lattice, name_Set, Position, node_data, name_Assembly):
     """
     Create a set of nodes at the extremity of the lattice
@@ -155,37 +191,22 @@ def CreateSet(name_model, lattice, name_Set, Position, node_data, name_Assembly)
         Name of the set.
     Position : str
         Position of the set. (x+,x-,y+,y-,z+,z-)
-    node_data : list
-        List of nodes.
+    node_data : np.ndarray
+        Nodes of the lattice. (index, x, y, z, ...)
     name_Assembly : str
         Name of the assembly.
     """
     #Traitement Position
-    if 'x' in Position:
-        Direction = 1
-        if '+' in Position:
-            valselected = lattice.xMax
-        else:
-            valselected = lattice.xMin
-    elif 'y' in Position:
-        Direction = 2
-        if '+' in Position:
-            valselected = lattice.yMax
-        else:
-            valselected = lattice.yMin
-    elif 'z' in Position:
-        Direction = 3
-        if '+' in Position:
-            valselected = lattice.zMax
-        else:
-            valselected = lattice.zMin
+    Direction, attr = _POSITIONS[Position]
+    valselected = getattr(lattice, attr)
     m = mdb.models[name_model]
     a = m.rootAssembly
     v1 = a.instances[name_Assembly].vertices
-    verts1 = []
-    for i in range(len(node_data)):
-        if node_data[i][Direction] == valselected:
-            verts1.append(v1.findAt(((node_data[i][1], node_data[i][2], node_data[i][3]),), ))
+    arr = np.ascontiguousarray(node_data, dtype=np.float64)
+    sel = arr[arr[:, Direction] == valselected][:, 1:4]
+    pts = tuple((tuple(pt),) for pt in sel.tolist())
+    # Single geometric query for all boundary nodes
+    verts1 = v1.findAt(*pts)
     a.Set(vertices=verts1, name=name_Set)
 
 
@@ -202,7 +223,7 @@ def mesh_Part(name_model, name_Part, mesh_size):
     mesh_size : float
         Size of the mesh.
     """
-    p = mdb.models[name_model].parts[name_Part]
+    p = _get_part(name_model, name_Part)
     p.seedPart(size=mesh_size, deviationFactor=0.1, minSizeFactor=0.1)
     p.generateMesh()
 
@@ -211,13 +232,47 @@ def getUniqueRadius():
     """
     Get unique radius of the lattice
 
+    The result is cached on the lattice, delete lattice._unique_r if radii are modified.
+    The order of set() is kept : constructLatticeAbaqus selects the profiles by their position in this list
+
     Returns
     -------
     list
         List of unique radius
     """
-    uniqueRadius = list(set(lattice.radius))
-    return uniqueRadius
+    uniqueRadius = getattr(lattice, '_unique_r', None)
+    if uniqueRadius is None:
+        uniqueRadius = list(set(lattice.radius))
+        lattice._unique_r = uniqueRadius
+    return list(uniqueRadius)
+
+
+def Create_Circular_Profiles(name_model, name_Beam_Profile):
+    """
+    Create a circular profile for each unique radius of the lattice
+
+    Parameters
+    ----------
+    name_model : str
+        Name of the model.
+    name_Beam_Profile : str
+        Prefix of the profile names.
+
+    Returns
+    -------
+    list
+        Names of the profiles, in the order of getUniqueRadius
+    """
+    m = mdb.models[name_model]
+    uniqueRadius = getUniqueRadius()
+    existing = set(m.profiles.keys())  # Profiles from a previous run are reused
+    name = []
+    for r in uniqueRadius:
+        name_profile = f"{name_Beam_Profile}_{r}"
+        if name_profile not in existing:
+            m.CircularProfile(name=name_profile, r=r)
+        name.append(name_profile)
+    return name
 
 
 def Create_Beam_Profile_Mod(name_model, name_Part, VectorOrientation, name_region, name_Beam_Profile):
@@ -238,18 +293,13 @@ def Create_Beam_Profile_Mod(name_model, name_Part, VectorOrientation, name_regio
         Name of the beam profile.
     """
     # Beam Section Orientation
-    p = mdb.models[name_model].parts[name_Part]
+    p = _get_part(name_model, name_Part)
     Region_mid, Region_Ext = selectBeamRegion(name_region)
-    p.assignBeamSectionOrientation(region=Region_mid, method=N1_COSINES,
-                                   n1=(VectorOrientation[0], VectorOrientation[1], VectorOrientation[2]))
-    p.assignBeamSectionOrientation(region=Region_Ext, method=N1_COSINES,
+    # BeamMid and BeamMod together cover the AllBeams set
+    p.assignBeamSectionOrientation(region=p.sets['AllBeams'], method=N1_COSINES,
                                    n1=(VectorOrientation[0], VectorOrientation[1], VectorOrientation[2]))
     # Beam Profile creation
-    uniqueRadius = getUniqueRadius()
-    name = []
-    for i in range(len(uniqueRadius)):
-        mdb.models[name_model].CircularProfile(name=name_Beam_Profile + '_' + str(uniqueRadius[i]), r=uniqueRadius[i])
-        name.append(name_Beam_Profile + '_' + str(uniqueRadius[i]))
+    name = Create_Circular_Profiles(name_model, name_Beam_Profile)
     return name, Region_mid, Region_Ext
 
 
@@ -271,19 +321,35 @@ def Create_Beam_Profile(name_model, name_Part, VectorOrientation, name_region, n
         Name of the beam profile.
     """
     # Beam Section Orientation
-    p = mdb.models[name_model].parts[name_Part]
+    p = _get_part(name_model, name_Part)
     AllBeams = selectBeamRegion(name_region)
     p.assignBeamSectionOrientation(region=AllBeams, method=N1_COSINES,
                                    n1=(VectorOrientation[0], VectorOrientation[1], VectorOrientation[2]))
     # Beam Profile creation
-    uniqueRadius = getUniqueRadius()
-    name = []
-    for i in range(len(uniqueRadius)):
-        mdb.models[name_model].CircularProfile(name=name_Beam_Profile + '_' + str(uniqueRadius[i]), r=uniqueRadius[i])
-        name.append(name_Beam_Profile + '_' + str(uniqueRadius[i]))
+    name = Create_Circular_Profiles(name_model, name_Beam_Profile)
     return name, AllBeams
 
 
+def _beam_mids_numpy(nodes, beams):
+    """
+    Get the middle point of the center beams (type 0) of the lattice
+
+    Parameters
+    ----------
+    nodes : np.ndarray
+        Nodes of the lattice. (index, x, y, z, ...)
+    beams : np.ndarray
+        Beams of the lattice. (index, node1, node2, type, ...)
+
+    Returns
+    -------
+    np.ndarray
+        Coordinates of the middle points, shape (n, 3)
+    """
+    b = beams[beams[:, 3] == 0].astype(np.int64)  #Check type of beam Center or modified
+    return 0.5 * (nodes[b[:, 1], 1:4] + nodes[b[:, 2], 1:4])
+
+
 def selectBeamRegion(name_region):
     """
     Select the region of the structure to apply the beam section
@@ -293,7 +359,7 @@ def selectBeamRegion(name_region):
     name_region : str
         Name of the region. (AllBeams, BeamMid, BeamMod, X1, X2, X3, Y1, Y2, Y3, Z1, Z2, Z3)
     """
-    p = mdb.models[name_model].parts[name_Part]
+    p = _get_part(name_model, name_Part)
     e = p.edges
     if name_region == 'AllBeams':  #Traitement all beams
         edges = e.getByBoundingBox(xMin=lattice.xMin, yMin=lattice.yMin, zMin=lattice.zMin, xMax=lattice.xMax,
@@ -304,24 +370,14 @@ def selectBeamRegion(name_region):
                                    yMax=lattice.yMax, zMax=lattice.zMax)
         Region = p.Set(edges=edges, name='AllBeams')
         # For normal beams
-        edges_mid = []
-        for i in range(len(lattice.beams)):
-            if lattice.beams[i][3] == 0:  #Check type of beam Center or modified
-                edges_mid.append(e.findAt(((lattice.nodes[lattice.beams[i][1]][1] + (
-                        lattice.nodes[lattice.beams[i][2]][1] - lattice.nodes[lattice.beams[i][1]][1]) / 2,
-                                            lattice.nodes[lattice.beams[i][1]][2] + (
-                                                    lattice.nodes[lattice.beams[i][2]][2] -
-                                                    lattice.nodes[lattice.beams[i][1]][2]) / 2,
-                                            lattice.nodes[lattice.beams[i][1]][3] + (
-                                                    lattice.nodes[lattice.beams[i][2]][3] -
-                                                    lattice.nodes[lattice.beams[i][1]][3]) / 2),), ))
+        mids = _beam_mids_numpy(lattice.nodes_np, lattice.beams_np)
+        edges_mid = e.findAt(*[(tuple(mid),) for mid in mids.tolist()])
         region_mid = p.Set(edges=edges_mid, name='BeamMid')
         # For Modified beams
-        p = mdb.models[name_model].parts[name_Part]
         region_ext = p.SetByBoolean(name='BeamMod', operation=DIFFERENCE, sets=(p.sets['AllBeams'], p.sets['BeamMid'],))
         return region_mid, region_ext
     else:  # Traitement couche par couche ################## Probleme lors de poutres qui apparraisent dans 2 couche differentes Il faut un traitement different
-        couche_number = int(re.search(r'\d+', name_region).group())
+        couche_number = int(name_region[1:])  # Names are X1, Y2, Z3, ...
         if 'X' in name_region:
             edges = e.getByBoundingBox(
                 xMin=lattice.xMax - ((lattice.numCellsX + 1 - couche_number) * lattice.cellSizeX), yMin=lattice.yMin,
@@ -393,7 +449,7 @@ def Create_Beam_Section(name_model, name_Section, name_material, name_Beam_Profi
                                        poissonRatio=0.0, profile=name_Beam_Profile, material=name_material,
                                        temperatureVar=LINEAR, consistentMassMatrix=False)
     # Beam assignment
-    p = mdb.models[name_model].parts[name_Part]
+    p = _get_part(name_model, name_Part)
     p.SectionAssignment(region=Region, sectionName=name_Section, offset=0.0,
                         offsetType=MIDDLE_SURFACE, offsetField='',
                         thicknessAssignment=FROM_SECTION)
@@ -463,52 +519,58 @@ def Create_Step(name_model, name_step, name_previous_step, AnalysisType):
 
 
 def Create_BC_Fixed(name_model, name_step, name_set):
-    a = mdb.models[name_model].rootAssembly
-    region = region = a.sets[name_set]
-    mdb.models[name_model].EncastreBC(name='Fixed', createStepName=name_step, region=region, localCsys=None)
+    m = mdb.models[name_model]
+    a = m.rootAssembly
+    region = a.sets[name_set]
+    m.EncastreBC(name='Fixed', createStepName=name_step, region=region, localCsys=None)
 
 
 def Create_Loads(name_model, name_step, name_set, name_load, vector_load):
-    a = mdb.models[name_model].rootAssembly
+    m = mdb.models[name_model]
+    a = m.rootAssembly
     region = a.sets[name_set]
-    mdb.models[name_model].DisplacementBC(name=name_load, createStepName=name_step,
-                                          region=region, u1=vector_load[0], u2=vector_load[1], u3=vector_load[2],
-                                          ur1=UNSET, ur2=UNSET, ur3=UNSET,
-                                          amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='',
-                                          localCsys=None)
+    m.DisplacementBC(name=name_load, createStepName=name_step,
+                     region=region, u1=vector_load[0], u2=vector_load[1], u3=vector_load[2],
+                     ur1=UNSET, ur2=UNSET, ur3=UNSET,
+                     amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='',
+                     localCsys=None)
 
 
 def Create_Loads_Surface(name_model, name_step, name_surface_Assembly, name_load, vector_load):
-    a = mdb.models[name_model].rootAssembly
+    m = mdb.models[name_model]
+    a = m.rootAssembly
     r1 = a.instances[name_surface_Assembly].referencePoints
     refPoints1 = (r1[2],)
     region = regionToolset.Region(referencePoints=refPoints1)
-    mdb.models[name_model].DisplacementBC(name=name_load, createStepName=name_step,
-                                          region=region, u1=vector_load[0], u2=vector_load[1], u3=vector_load[2],
-                                          ur1=UNSET, ur2=UNSET, ur3=UNSET,
-                                          amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='',
-                                          localCsys=None)
+    m.DisplacementBC(name=name_load, createStepName=name_step,
+                     region=region, u1=vector_load[0], u2=vector_load[1], u3=vector_load[2],
+                     ur1=UNSET, ur2=UNSET, ur3=UNSET,
+                     amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='',
+                     localCsys=None)
 
 
 def Create_GetReactionForce(name_model, name_step, name_set):
-    regionDef = mdb.models[name_model].rootAssembly.sets[name_set]
-    mdb.models[name_model].HistoryOutputRequest(name='Reaction_Force',
-                                                createStepName=name_step, variables=('RF1', 'RF2', 'RF3'),
-                                                region=regionDef,
-                                                sectionPoints=DEFAULT, rebar=EXCLUDE)
+    m = mdb.models[name_model]
+    regionDef = m.rootAssembly.sets[name_set]
+    m.HistoryOutputRequest(name='Reaction_Force',
+                           createStepName=name_step, variables=('RF1', 'RF2', 'RF3'),
+                           region=regionDef,
+                           sectionPoints=DEFAULT, rebar=EXCLUDE)
 
 
 def Create_GetDisplacement(name_model, name_step, name_set):
-    regionDef = mdb.models[name_model].rootAssembly.sets[name_set]
-    mdb.models[name_model].HistoryOutputRequest(name='Displacement',
-                                                createStepName=name_step, variables=('U1', 'U2', 'U3'),
-                                                region=regionDef,
-                                                sectionPoints=DEFAULT, rebar=EXCLUDE)
+    m = mdb.models[name_model]
+    regionDef = m.rootAssembly.sets[name_set]
+    m.HistoryOutputRequest(name='Displacement',
+                           createStepName=name_step, variables=('U1', 'U2', 'U3'),
+                           region=regionDef,
+                           sectionPoints=DEFAULT, rebar=EXCLUDE)
 
 
 def Delete_output_default(name_model):
-    del mdb.models[name_model].historyOutputRequests['H-Output-1']
-    mdb.models[name_model].fieldOutputRequests['F-Output-1'].setValues(variables=('S', 'PE', 'PEEQ', 'U', 'RF'))
+    m = mdb.models[name_model]
+    del m.historyOutputRequests['H-Output-1']
+    m.fieldOutputRequests['F-Output-1'].setValues(variables=('S', 'PE', 'PEEQ', 'U', 'RF'))
 
 
 def visualizationSimulation(name_Job):
@@ -568,11 +630,14 @@ def constructLatticeAbaqus(name_model, name_Part, name_Assembly, Lattice_Type, M
 def getReactionForce(name_Job):
     # Create file with all reaction force data
     file_path = '/abaqus.rpt'
-    odb = session.odbs['D:/travail_Abaqus/Lattice/' + name_Job + '.odb']
+    odb_path = 'D:/travail_Abaqus/Lattice/' + name_Job + '.odb'
+    if odb_path not in session.odbs.keys():  # Reuse the odb already opened by visualizationSimulation
+        session.openOdb(name=odb_path, readOnly=True)
+    odb = session.odbs[odb_path]
     session.writeFieldReport(fileName=file_path, append=OFF,
                              sortItem='Node Label', odb=odb, step=0, frame=1, outputPosition=NODAL,
                              variable=(('RF', NODAL),), stepFrame=SPECIFY)
-    reactionforceData = []
+    rows = []
     with open(file_path, 'r') as file:
         is_data_section = False  # Indicateur pour savoir si nous sommes dans la section des donnees
         for line in file:
@@ -584,58 +649,60 @@ def getReactionForce(name_Job):
                 is_data_section = False
                 continue
             if is_data_section:
-                # Separation des valeurs en utilisant les espaces comme separateurs
                 values = line.split()
-                if len(values) == 5 and float(values[1]) != 0:  # Nous nous attendons a 4 valeurs numeriques par ligne
-                    node_label = int(values[0])
-                    rf_magnitude = float(values[1])
-                    rf_rf1 = float(values[2])
-                    rf_rf2 = float(values[3])
-                    rf_rf3 = float(values[4])
-                    reactionforceData.append((node_label, rf_magnitude, rf_rf1, rf_rf2, rf_rf3))
-    fixedNodeReactionForce = []
-    reactionForceZ = 0
-    for i in range(len(reactionforceData)):
-        if reactionforceData[i][4] > 0:
-            fixedNodeReactionForce.append(reactionforceData[i])
-            reactionForceZ += reactionforceData[i][4]
+                # Lignes numeriques : Node Label, RF Magnitude, RF1, RF2, RF3 (les lignes d'en-tete sont ignorees)
+                if len(values) == 5 and values[0].isdigit():
+                    rows.append(line)
+    reactionForceZ = 0.0
+    if rows:
+        data = np.loadtxt(rows, dtype=np.float64, ndmin=2)
+        reactionForceZ = float(data[data[:, 4] > 0, 4].sum())
     print(reactionForceZ)
     return reactionForceZ
 
 
 def get_result(name_Job, name_step):
-    odb = openOdb(name_Job + '.odb')
-    historyRegions = odb.steps[name_step].historyRegions
-
-    dataRF = {'RF1': [], 'RF2': [], 'RF3': []}
-    dataU = {'U1': [], 'U2': [], 'U3': []}
-    dataTime = []
-
-    for key in historyRegions.keys():
-        historyRegion = historyRegions[key]
-
-        # Traitement pour RF1, RF2, RF3
-        for rf_key in dataRF.keys():
-            try:
-                rf_data = historyRegion.historyOutputs[rf_key].data
-                if not dataRF[rf_key]:  # Si la liste est vide
-                    dataRF[rf_key] = [value for _, value in rf_data]
-                else:
-                    for i, (_, value) in enumerate(rf_data):
-                        dataRF[rf_key][i] += value
-            except KeyError:
-                pass
-
-        # Traitement pour U1, U2, U3
-        for u_key in dataU.keys():
-            try:
-                u_data = historyRegion.historyOutputs[u_key].data
-                if not dataU[u_key]:  # Si la liste est vide
-                    dataU[u_key] = [value for _, value in u_data]
-                    if u_key == 'U1':  # Assurer que dataTime est seulement rempli une fois
-                        dataTime = [time for time, _ in u_data]
-            except KeyError:
-                pass
+    odb_path = 'D:/travail_Abaqus/Lattice/' + name_Job + '.odb'
+    opened = odb_path not in session.odbs.keys()  # Reuse the odb already opened by visualizationSimulation
+    if opened:
+        odb = openOdb(path=odb_path, readOnly=True)
+    else:
+        odb = session.odbs[odb_path]
+    try:
+        historyRegions = odb.steps[name_step].historyRegions
+
+        dataRF = {'RF1': np.zeros(0), 'RF2': np.zeros(0), 'RF3': np.zeros(0)}
+        dataU = {'U1': np.zeros(0), 'U2': np.zeros(0), 'U3': np.zeros(0)}
+        dataTime = np.zeros(0)
+
+        for key in historyRegions.keys():
+            historyRegion = historyRegions[key]
+
+            # Traitement pour RF1, RF2, RF3
+            for rf_key in dataRF.keys():
+                try:
+                    rf_data = historyRegion.historyOutputs[rf_key].data
+                    values = np.fromiter((value for _, value in rf_data), dtype=np.float64, count=len(rf_data))
+                    if not dataRF[rf_key].size:  # Premiere region rencontree
+                        dataRF[rf_key] = values
+                    else:
+                        dataRF[rf_key] += values
+                except KeyError:
+                    pass
+
+            # Traitement pour U1, U2, U3
+            for u_key in dataU.keys():
+                try:
+                    u_data = historyRegion.historyOutputs[u_key].data
+                    if not dataU[u_key].size:  # Premiere region rencontree
+                        dataU[u_key] = np.fromiter((value for _, value in u_data), dtype=np.float64, count=len(u_data))
+                        if u_key == 'U1':  # Assurer que dataTime est seulement rempli une fois
+                            dataTime = np.fromiter((time for time, _ in u_data), dtype=np.float64, count=len(u_data))
+                except KeyError:
+                    pass
+    finally:
+        if opened:  # Only close the odb opened here
+            odb.close()
 
     return dataRF, dataU, dataTime
 
@@ -643,23 +710,17 @@ def get_result(name_Job, name_step):
 def save_result(Lattice_Type, number_cell, AnalysisType, MethodSim, dataRF, dataU, dataTime):
     filename = Type_lattice(Lattice_Type) + "_" + str(number_cell) + str(AnalysisType) + str(MethodSim) + ".txt"
 
+    # One line per series : RF1, RF2, RF3, U1, U2, U3, time (empty line if the output is missing)
     with open(filename, "w") as f:
-        for rf_key in ['RF1', 'RF2', 'RF3']:
-            rf_data_str = np.array2string(np.array(dataRF[rf_key]), separator=',')
-            f.write(rf_data_str + "\n")
-
-        for u_key in ['U1', 'U2', 'U3']:
-            u_data_str = np.array2string(np.array(dataU[u_key]), separator=',')
-            f.write(u_data_str + "\n")
-
-        time_data_str = np.array2string(np.array(dataTime), separator=',')
-        f.write(time_data_str + "\n")
+        for data in [dataRF['RF1'], dataRF['RF2'], dataRF['RF3'], dataU['U1'], dataU['U2'], dataU['U3'], dataTime]:
+            np.savetxt(f, np.atleast_2d(data), delimiter=',', fmt='%.8g')
 
 def delete_all_models():
     model_names = list(mdb.models.keys())
     for name in model_names:
         if name != 'Model-1':  # 'Model-1' basic model
             del mdb.models[name]
+    _PART_CACHE.clear()
 
 
 #*******************************************************************************************************************
@@ -736,6 +797,9 @@ compressionPourcent = 20
 # Generate data from lattice
 lattice = Lattice(cell_size_X, cell_size_Y, cell_size_Z, number_cell_X, number_cell_Y, number_cell_Z, Lattice_Type,
                   Radius, gradRadiusProperty, gradDimProperty, gradMatProperty, MethodSim, False)
+# Array copies of nodes and beams shared by all the functions
+lattice.nodes_np = np.asarray(lattice.nodes, dtype=np.float64)
+lattice.beams_np = np.asarray(lattice.beams, dtype=np.float64)
 # Load vector
 displacementCompression = (lattice.zMax - lattice.zMin) * compressionPourcent / 100
 load_vector = [0, 0, -displacementCompression]
@@ -746,8 +810,8 @@ if AnalysisType == 1:
     # Create assembly for lattice 
     Assembly_beam(name_model, name_Part, name_Assembly)
     # Create set for fixed nodes and loaded nodes
-    CreateSet(name_model, lattice, 'Fixed_nodes', "z-", lattice.nodes, name_Assembly)
-    CreateSet(name_model, lattice, 'loaded_nodes', "z+", lattice.nodes, name_Assembly)
+    CreateSet(name_model, lattice, 'Fixed_nodes', "z-", lattice.nodes_np, name_Assembly)
+    CreateSet(name_model, lattice, 'loaded_nodes', "z+", lattice.nodes_np, name_Assembly)
     # Create loading condition and submit job
     name_step = 'Step-1'
     Create_Step(name_model, name_step, 'Initial', AnalysisType)
@@ -1,53 +1,61 @@
 from odbAccess import openOdb
+try:
+    from abaqus import session
+except ImportError:  # Script run with abaqus python : no session, no odb already opened
+    session = None
 
 import numpy as np
 from Lattice_description import *
 
 
 def get_result(name_Job, name_step):
-    odb = openOdb(name_Job + '.odb')
-    historyRegions = odb.steps[name_step].historyRegions
-    dataRF = {'RF1': [], 'RF2': [], 'RF3': []}
-    dataU = {'U1': [], 'U2': [], 'U3': []}
-    dataTime = []
-    for key in historyRegions.keys():
-        historyRegion = historyRegions[key]
-        # Traitement pour RF1, RF2, RF3
-        for rf_key in dataRF.keys():
-            try:
-                rf_data = historyRegion.historyOutputs[rf_key].data
-                if not dataRF[rf_key]:  # Si la liste est vide
-                    dataRF[rf_key] = [value for _, value in rf_data]
-                else:
-                    for i, (_, value) in enumerate(rf_data):
-                        dataRF[rf_key][i] += value
-            except KeyError:
-                pass
-        # Traitement pour U1, U2, U3
-        for u_key in dataU.keys():
-            try:
-                u_data = historyRegion.historyOutputs[u_key].data
-                if not dataU[u_key]:  # Si la liste est vide
-                    dataU[u_key] = [value for _, value in u_data]
-                    if u_key == 'U1':  # Assurer que dataTime est seulement rempli une fois
-                        dataTime = [time for time, _ in u_data]
-            except KeyError:
-                pass
+    odb_path = name_Job + '.odb'
+    opened = session is None or odb_path not in session.odbs.keys()  # Reuse the odb already opened in the session
+    if opened:
+        odb = openOdb(path=odb_path, readOnly=True)
+    else:
+        odb = session.odbs[odb_path]
+    try:
+        historyRegions = odb.steps[name_step].historyRegions
+        dataRF = {'RF1': np.zeros(0), 'RF2': np.zeros(0), 'RF3': np.zeros(0)}
+        dataU = {'U1': np.zeros(0), 'U2': np.zeros(0), 'U3': np.zeros(0)}
+        dataTime = np.zeros(0)
+        for key in historyRegions.keys():
+            historyRegion = historyRegions[key]
+            # Traitement pour RF1, RF2, RF3
+            for rf_key in dataRF.keys():
+                try:
+                    rf_data = historyRegion.historyOutputs[rf_key].data
+                    values = np.fromiter((value for _, value in rf_data), dtype=np.float64, count=len(rf_data))
+                    if not dataRF[rf_key].size:  # Premiere region rencontree
+                        dataRF[rf_key] = values
+                    else:
+                        dataRF[rf_key] += values
+                except KeyError:
+                    pass
+            # Traitement pour U1, U2, U3
+            for u_key in dataU.keys():
+                try:
+                    u_data = historyRegion.historyOutputs[u_key].data
+                    if not dataU[u_key].size:  # Premiere region rencontree
+                        dataU[u_key] = np.fromiter((value for _, value in u_data), dtype=np.float64, count=len(u_data))
+                        if u_key == 'U1':  # Assurer que dataTime est seulement rempli une fois
+                            dataTime = np.fromiter((time for time, _ in u_data), dtype=np.float64, count=len(u_data))
+                except KeyError:
+                    pass
+    finally:
+        if opened:  # Only close the odb opened here
+            odb.close()
     return dataRF, dataU, dataTime
 
 def save_result(Lattice_Type, number_cell, AnalysisType, MethodSim, dataRF, dataU, dataTime, Radius):
     Radius = str(Radius).replace('.', '_')
     filename = Type_lattice(Lattice_Type)+"_"+str(number_cell)+str(AnalysisType)+str(MethodSim)+Radius+".txt"
     print(filename)
+    # One line per series : RF1, RF2, RF3, U1, U2, U3, time (empty line if the output is missing)
     with open(filename, "w") as f:
-        for rf_key in ['RF1', 'RF2', 'RF3']:
-            rf_data_str = np.array2string(np.array(dataRF[rf_key]), separator=',')
-            f.write(rf_data_str + "\n")
-        for u_key in ['U1', 'U2', 'U3']:
-            u_data_str = np.array2string(np.array(dataU[u_key]), separator=',')
-            f.write(u_data_str + "\n")
-        time_data_str = np.array2string(np.array(dataTime), separator=',')
-        f.write(time_data_str + "\n")
+        for data in [dataRF['RF1'], dataRF['RF2'], dataRF['RF3'], dataU['U1'], dataU['U2'], dataU['U3'], dataTime]:
+            np.savetxt(f, np.atleast_2d(data), delimiter=',', fmt='%.8g')
 
 # name_Job = 'Job-beammod'
 name_Job = 'beamMod1_5'
@@ -5,51 +5,52 @@ import pandas as pd
 from Lattice_description import *
 
 
-def openFile(Lattice_Type,number_cell,AnalysisType,MethodSim):
-    file_path = "D:/travail_Abaqus/Lattice/"+Type_lattice(Lattice_Type)+"_"+str(number_cell)+str(AnalysisType)+str(MethodSim)+".txt"
+def readResultFile(file_path):
+    """
+    Read a result file written by save_result
+
+    Returns
+    -------
+    list
+        Series of the file, in the order they were written
+    bool
+        True for the old format of np.array2string (bracketed blocks, possibly on several lines)
+    """
     with open(file_path, 'r') as file:
-        dataRF = []
-        dataU = []
-        dataTime = []
-        idx = 0
-        for line in file:
-            linet = np.fromstring(line.strip('[]\n'), sep=',')
-            if idx == 0:
-                dataRF.append(linet)
-            elif idx == 1:
-                dataU.append(linet)
-            elif idx == 2:
-                dataTime.append(linet)
+        lines = file.readlines()
+    if lines and lines[0].startswith('['):
+        # Ancien format : un bloc [..] par serie, un bloc peut s'etendre sur plusieurs lignes
+        series = []
+        current = []
+        for line in lines:
+            values = line.strip('[]\n ')
+            if values:
+                current.extend(np.fromstring(values, sep=','))
             if ']' in line:
-                idx+=1
-    return np.concatenate(dataRF),np.concatenate(dataU),np.concatenate(dataTime)
+                series.append(np.array(current))
+                current = []
+        return series, True
+    # Nouveau format : une ligne par serie (ligne vide si la sortie est absente)
+    series = [np.array(line.split(','), dtype=np.float64) if line.strip() else np.zeros(0) for line in lines]
+    return series, False
 
-def openFile_all_data(Lattice_Type, number_cell, AnalysisType, MethodSim):
-    file_path = f"D:/travail_Abaqus/Lattice/{Type_lattice(Lattice_Type)}_{number_cell}{AnalysisType}{MethodSim}.txt"
-    dataRF = {'RF1': [], 'RF2': [], 'RF3': []}
-    dataU = {'U1': [], 'U2': [], 'U3': []}
-    dataTime = []
-    current_data_list = []
 
-    # Déterminer l'ordre dans lequel les données apparaissent
-    data_order = ['RF1', 'RF2', 'RF3', 'U1', 'U2', 'U3', 'dataTime']
-    current_index = 0
+def openFile(Lattice_Type,number_cell,AnalysisType,MethodSim):
+    file_path = "D:/travail_Abaqus/Lattice/"+Type_lattice(Lattice_Type)+"_"+str(number_cell)+str(AnalysisType)+str(MethodSim)+".txt"
+    series, old_format = readResultFile(file_path)
+    if old_format:
+        # Trois premiers blocs du fichier
+        return series[0], series[1], series[2]
+    # Donnees pour la compression selon Z : RF3, U3 et dataTime
+    return series[2], series[5], series[6]
 
-    with open(file_path, 'r') as file:
-        for line in file:
-            # Accumuler les données numériques
-            current_data_list.extend(np.fromstring(line.strip('[]\n'), sep=','))
-            if ']' in line:  # Vérifier la fin de la catégorie actuelle
-                # Attribuer les données accumulées à la catégorie correspondante
-                if current_index < 3:  # RF1, RF2, RF3
-                    dataRF[data_order[current_index]] = np.array(current_data_list)
-                elif current_index < 6:  # U1, U2, U3
-                    dataU[data_order[current_index]] = np.array(current_data_list)
-                else:  # dataTime
-                    dataTime = np.array(current_data_list)
-                # Réinitialiser pour la prochaine catégorie de données
-                current_data_list = []
-                current_index += 1
+def openFile_all_data(Lattice_Type, number_cell, AnalysisType, MethodSim):
+    file_path = f"D:/travail_Abaqus/Lattice/{Type_lattice(Lattice_Type)}_{number_cell}{AnalysisType}{MethodSim}.txt"
+    # Series dans l'ordre : RF1, RF2, RF3, U1, U2, U3, dataTime
+    data, _ = readResultFile(file_path)
+    dataRF = {'RF1': data[0], 'RF2': data[1], 'RF3': data[2]}
+    dataU = {'U1': data[3], 'U2': data[4], 'U3': data[5]}
+    dataTime = data[6]
 
     return dataRF, dataU, dataTime
 